@@ -3,7 +3,16 @@ import re
 import json
 import time
 import os
+import gzip
+import codecs
+import hashlib
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from bs4 import BeautifulSoup
+from bs4.dammit import EntitySubstitution
+from html.parser import HTMLParser
 from pathlib import Path
 
 # Dictionary mapping full language names to their Wikipedia language codes
@@ -26,6 +35,56 @@ TEST_MODE = False
 USE_KNOWN_ARTICLES = False  # Use random articles from Wikipedia
 ARTICLES_PER_LANGUAGE = 6250  # 25,000 total / 4 languages
 
+# Offline availability index built from the Wikipedia SQL dumps
+# (https://dumps.wikimedia.org/). Dumps are expected as e.g.
+# dumps/enwiki-latest-langlinks.sql.gz and dumps/enwiki-latest-page.sql.gz
+USE_LANGLINKS_INDEX = True
+DUMP_DIR = Path("dumps")
+LANGLINKS_INDEX_FILE = Path("extracted_articles") / "langlinks_index.npz"
+
+# Only the rows we need are matched: langlinks rows pointing to one of the
+# target languages, and page rows in the main (article) namespace that are
+# not redirects (page_id, page_namespace, page_title, page_is_redirect, ...)
+SQL_STRING = r"'((?:[^'\\]|\\.)*)'"
+SQL_ESCAPES = {'0': '\0', 'n': '\n', 'r': '\r', 't': '\t', 'Z': '\x1a'}
+PAGE_ROW_PATTERN = re.compile(r"\((\d+),0," + SQL_STRING + ",0,")
+
+# Stream article HTML into an incremental parser instead of building a full tree
+STREAMING_EXTRACTION = True
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# Elements without an end tag, and elements whose text is not article text
+# (same rules as BeautifulSoup's html.parser tree builder)
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen',
+    'link', 'menuitem', 'meta', 'param', 'source', 'track', 'wbr',
+    'basefont', 'bgsound', 'command', 'frame', 'image', 'isindex', 'nextid', 'spacer'
+}
+NON_TEXT_ELEMENTS = {'script', 'style', 'template', 'rt', 'rp'}
+
+# Pre-fetch filter: reject stubs and non-articles using page metadata before
+# downloading any HTML (page length is the size of the wikitext in bytes)
+PREFILTER_ARTICLES = True
+MIN_ARTICLE_BYTES = {'en': 3000, 'tl': 1500, 'ilo': 1500, 'ceb': 1500}
+REJECTED_PAGE_PROPS = {'disambiguation'}
+API_BATCH_SIZE = 50  # Maximum number of titles per API query
+PREFILTER_SAVE_INTERVAL = 10  # Save the pre-filter results every N batches of titles
+
+# Translation: text is split into segments, batched per backend call and
+# memoized per segment in a persistent cache
+TRANSLATION_BACKEND = 'translators'  # 'translators' or 'local' (deterministic, offline)
+TRANSLATOR_SERVICE = 'google'  # Service used by the translators package
+TRANSLATION_CACHE_FILE = Path("extracted_articles") / "translation_cache.sqlite3"
+MAX_BATCH_CHARS = 4000  # Maximum characters per backend call
+MAX_BATCH_SEGMENTS = 50  # Maximum segments per backend call
+TRANSLATION_WORKERS = 4  # Concurrent backend calls
+TRANSLATION_MIN_INTERVAL = 0.5  # Minimum seconds between backend calls
+
+# Availability discovery state: titles rejected because they are missing in some
+# language are not checked again until their entry is older than this
+NEGATIVE_CACHE_TTL = 30 * 24 * 3600  # seconds
+AVAILABILITY_SAVE_INTERVAL = 50  # Save the discovery state every N checked titles
+
 def scrape_wikipedia_article(lang_code, article_title):
     """
     Scrapes the main text content of a Wikipedia article.
@@ -68,16 +127,210 @@ def scrape_wikipedia_article(lang_code, article_title):
         # Extract text from all paragraph tags within the main content
         paragraphs = content_div.find_all('p')
         
-        # Combine the text from all paragraphs
-        article_text = ' '.join([para.get_text() for para in paragraphs])
+        return join_paragraphs([para.get_text() for para in paragraphs])
 
-        # Clean the text by removing citation brackets (e.g., [1], [2], [citation needed])
-        cleaned_text = re.sub(r'\[.*?\]', '', article_text)
-        
-        # Replace multiple newlines/spaces with a single space
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text).strip()
+    except requests.exceptions.RequestException as e:
+        print(f"Error fetching the article: {e}")
+        return None
+
+def join_paragraphs(paragraphs):
+    """
+    Combines the paragraph texts of an article into a single cleaned string.
+
+    Args:
+        paragraphs (list): The text of each paragraph, in document order.
+
+    Returns:
+        str: The combined text.
+    """
+    # Combine the text from all paragraphs
+    article_text = ' '.join(paragraphs)
+
+    # Clean the text by removing citation brackets (e.g., [1], [2], [citation needed])
+    cleaned_text = re.sub(r'\[.*?\]', '', article_text)
+    
+    # Replace multiple newlines/spaces with a single space
+    cleaned_text = re.sub(r'\s+', ' ', cleaned_text).strip()
+
+    return cleaned_text
+
+class ParagraphParser(HTMLParser):
+    """
+    Incremental parser collecting the text of the <p> elements inside #mw-content-text.
+
+    Only the stack of open tag names and the text of the currently open paragraphs
+    are kept, so memory does not grow with the size of the page. Completed
+    paragraphs are returned by pop_paragraphs() as soon as they are closed.
+    """
+
+    def __init__(self):
+        # Character references are resolved below, the way BeautifulSoup does it
+        super().__init__(convert_charrefs=False)
+        self.open_tags = []
+        self.non_text_depth = 0
+        self.content_depth = None
+        self.found_content = False
+        self.paragraphs = []  # Paragraphs not yet returned, in document order
+        self.open_paragraphs = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_ELEMENTS:
+            return
+
+        self.open_tags.append(tag)
+        if tag in NON_TEXT_ELEMENTS:
+            self.non_text_depth += 1
+
+        if not self.found_content and dict(attrs).get('id') == 'mw-content-text':
+            self.found_content = True
+            self.content_depth = len(self.open_tags)
+        elif self.content_depth is not None and tag == 'p':
+            paragraph = {"depth": len(self.open_tags), "parts": [], "closed": False}
+            self.paragraphs.append(paragraph)
+            self.open_paragraphs.append(paragraph)
+
+    def handle_endtag(self, tag):
+        # Like BeautifulSoup, close everything up to the matching open tag
+        # and ignore end tags that do not match any open tag
+        if tag not in self.open_tags:
+            return
+        while True:
+            closed_tag = self.open_tags.pop()
+            if closed_tag in NON_TEXT_ELEMENTS:
+                self.non_text_depth -= 1
+            if closed_tag == tag:
+                break
+
+        depth = len(self.open_tags)
+        while self.open_paragraphs and self.open_paragraphs[-1]["depth"] > depth:
+            self.open_paragraphs.pop()["closed"] = True
+        if self.content_depth is not None and self.content_depth > depth:
+            self.content_depth = None
+
+    def handle_data(self, data):
+        if self.non_text_depth:
+            return
+        self.add_text(data)
+
+    def add_text(self, data):
+        # Nested paragraphs are part of the text of every enclosing paragraph
+        for paragraph in self.open_paragraphs:
+            paragraph["parts"].append(data)
+
+    def handle_entityref(self, name):
+        # Unknown names (e.g. "&notit;") are kept as the literal "&name"
+        self.handle_data(EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name, f"&{name}"))
+
+    def handle_charref(self, name):
+        base = 16 if name[:1] in ('x', 'X') else 10
+        digits = name[1:] if base == 16 else name
+        extra_data = ''
+        try:
+            number = int(digits, base)
+        except ValueError:
+            # Keep the leading number and treat the rest as plain text
+            match = re.match(r'([0-9a-f]+)(.*)' if base == 16 else r'([0-9]+)(.*)', digits, re.DOTALL)
+            if match is None:
+                self.handle_data(digits)
+                return
+            number = int(match.group(1), base)
+            extra_data = match.group(2)
+
+        if number == 0 or number > 0x10ffff or 0xd800 <= number <= 0xdfff:
+            character = '\ufffd'
+        elif 0x80 <= number <= 0x9f:
+            # References using Windows-1252 code points instead of Unicode ones
+            try:
+                character = bytes([number]).decode('cp1252')
+            except UnicodeDecodeError:
+                character = chr(number)
+        else:
+            character = chr(number)
+        self.handle_data(character)
+        if extra_data:
+            self.handle_data(extra_data)
+
+    def unknown_decl(self, data):
+        # CDATA sections are text (even inside template or ruby text); other declarations are not
+        if data.upper().startswith('CDATA['):
+            self.add_text(data[len('CDATA['):])
+
+    def close(self):
+        super().close()
+        for paragraph in self.open_paragraphs:
+            paragraph["closed"] = True
+        self.open_paragraphs = []
+
+    def pop_paragraphs(self):
+        """Returns the text of the paragraphs completed since the last call."""
+        completed = []
+        while self.paragraphs and self.paragraphs[0]["closed"]:
+            completed.append(''.join(self.paragraphs.pop(0)["parts"]))
+        return completed
+
+def iter_article_paragraphs(chunks, parser):
+    """
+    Feeds HTML chunks to a ParagraphParser and yields paragraph texts as they complete.
+
+    Args:
+        chunks (iterable): The HTML of the page as str chunks.
+        parser (ParagraphParser): The parser to feed.
+
+    Yields:
+        str: The text of each paragraph inside #mw-content-text, in document order.
+    """
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from parser.pop_paragraphs()
+    parser.close()
+    yield from parser.pop_paragraphs()
+
+def scrape_wikipedia_article_streaming(lang_code, article_title):
+    """
+    Scrapes the main text content of a Wikipedia article while it downloads.
+
+    Produces the same text as scrape_wikipedia_article(), but parses the response
+    chunk by chunk instead of waiting for the whole page and building a tree.
+
+    Args:
+        lang_code (str): The two-letter language code for the Wikipedia domain (e.g., 'en', 'tl').
+        article_title (str): The title of the article to scrape.
+
+    Returns:
+        str: The cleaned text content of the article, or None if the article could not be fetched.
+    """
+    # Construct the Wikipedia URL
+    url = f"https://{lang_code}.wikipedia.org/wiki/{article_title.replace(' ', '_')}"
+    print(f"Fetching article from: {url}")
+
+    # Headers to identify as a legitimate bot
+    headers = {
+        'User-Agent': 'WikipediaExtractor/1.0 (https://github.com/your-repo; your-email@example.com) Python/3.12',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+    }
+
+    try:
+        with requests.get(url, headers=headers, timeout=10, stream=True) as response:
+            # Raise an exception for bad status codes (4xx or 5xx)
+            response.raise_for_status()
+
+            # Wikipedia serves UTF-8; only trust an explicitly declared charset
+            content_type = response.headers.get('Content-Type', '')
+            encoding = response.encoding if 'charset' in content_type.lower() else 'utf-8'
+            decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+
+            chunks = (decoder.decode(chunk) for chunk in response.iter_content(STREAM_CHUNK_SIZE))
+            parser = ParagraphParser()
+            paragraphs = list(iter_article_paragraphs(chunks, parser))
+
+        if not parser.found_content:
+            print("Could not find the main content area of the article.")
+            return None
 
-        return cleaned_text
+        return join_paragraphs(paragraphs)
 
     except requests.exceptions.RequestException as e:
         print(f"Error fetching the article: {e}")
@@ -173,7 +426,8 @@ def check_article_exists(lang_code, article_title):
         article_title (str): The title of the article to check.
         
     Returns:
-        bool: True if article exists, False otherwise.
+        bool: True if the article exists, False if it does not (404), or None if the
+              check failed (network error, rate limiting, server error, ...).
     """
     url = f"https://{lang_code}.wikipedia.org/wiki/{article_title.replace(' ', '_')}"
     
@@ -188,11 +442,16 @@ def check_article_exists(lang_code, article_title):
     
     try:
         response = requests.head(url, headers=headers, timeout=10, allow_redirects=True)
-        # Check if the page exists (not a 404)
-        return response.status_code == 200
+        if response.status_code == 200:
+            return True
+        # Only a 404 means the page does not exist; anything else is a failed check
+        if response.status_code == 404:
+            return False
+        print(f"    Error checking {lang_code}:{article_title}: HTTP {response.status_code}")
+        return None
     except Exception as e:
         print(f"    Error checking {lang_code}:{article_title}: {e}")
-        return False
+        return None
 
 def check_article_availability(article_title):
     """
@@ -202,7 +461,8 @@ def check_article_availability(article_title):
         article_title (str): The title of the article to check.
         
     Returns:
-        dict: Dictionary with language codes as keys and boolean availability as values.
+        dict: Dictionary with language codes as keys and availability as values
+              (True, False, or None if the check failed, see check_article_exists).
     """
     availability = {}
     
@@ -210,93 +470,618 @@ def check_article_availability(article_title):
         print(f"    Checking {lang_code}:{article_title}...")
         exists = check_article_exists(lang_code, article_title)
         availability[lang_code] = exists
-        print(f"      {'✓' if exists else '✗'} {lang_code}")
+        print(f"      {'?' if exists is None else '✓' if exists else '✗'} {lang_code}")
         time.sleep(0.5)  # Rate limiting
     
     return availability
 
-def get_articles_with_availability_check(limit=100):
+def get_articles_with_availability_check(limit=100, storage_dir=Path("extracted_articles")):
     """
     Gets articles from English Wikipedia and checks their availability in all languages.
     Optimized for large-scale extraction.
+
+    The discovery state (accepted and rejected titles) is persisted in
+    availability_progress.json, so an interrupted run resumes with the titles it
+    already accepted and does not re-check titles rejected within NEGATIVE_CACHE_TTL.
+    Titles whose check failed in some language are not recorded. Batches are fetched
+    until the target is met or a batch brings no new title to decide.
     
     Args:
         limit (int): Number of articles to retrieve.
+        storage_dir (Path): Storage directory holding the discovery state.
         
     Returns:
         list: List of article titles that exist in ALL target languages.
     """
+    state = load_availability_state(storage_dir)
+    available_articles = list(state["accepted"])
+    if available_articles:
+        print(f"Resuming with {len(available_articles)} available articles "
+              f"and {len(state['rejected'])} rejected titles")
+    if len(available_articles) >= limit:
+        return available_articles[:limit]
+
     print(f"Getting {limit} articles from English Wikipedia...")
     
     # For large-scale extraction, we'll use a more efficient approach
-    # Get articles in batches and check availability
+    # Get articles in batches and check availability until the target is met
     batch_size = 100
-    total_batches = (limit + batch_size - 1) // batch_size
+    batch_num = 0
     
-    available_articles = []
     total_checked = 0
+    total_decided = 0
+    skipped = 0
     
-    for batch_num in range(total_batches):
-        print(f"\n--- Batch {batch_num + 1}/{total_batches} ---")
-        
-        # Get a batch of English articles
-        batch_limit = min(batch_size, limit - len(available_articles))
-        english_articles = get_wikipedia_articles('en', batch_limit * 5)  # Get more to account for filtering
-        
-        if not english_articles:
-            print("No articles found in English Wikipedia!")
-            break
-        
-        print(f"Found {len(english_articles)} English articles in this batch. Checking availability...")
-        
-        for article_title in english_articles:
-            total_checked += 1
+    try:
+        while len(available_articles) < limit:
+            batch_num += 1
+            print(f"\n--- Batch {batch_num} ({len(available_articles)}/{limit} available) ---")
             
-            # Show progress every 10 articles
-            if total_checked % 10 == 0:
-                print(f"Progress: {total_checked} checked, {len(available_articles)} available")
+            # Get a batch of English articles
+            batch_limit = min(batch_size, limit - len(available_articles))
+            english_articles = get_wikipedia_articles('en', batch_limit * 5)  # Get more to account for filtering
             
-            availability = check_article_availability(article_title)
+            if not english_articles:
+                print("No articles found in English Wikipedia!")
+                break
             
-            # Check if article exists in ALL languages
-            all_available = all(availability.values())
+            print(f"Found {len(english_articles)} English articles in this batch. Checking availability...")
             
-            if all_available:
-                available_articles.append(article_title)
-                print(f"  ✓ [{len(available_articles)}/{limit}] {article_title}")
+            decided = 0
+            for article_title in english_articles:
+                # Skip titles decided by a previous check
+                if article_title in state["accepted"] or is_cached_rejection(state, article_title):
+                    skipped += 1
+                    continue
+
+                total_checked += 1
+                
+                # Show progress every 10 articles
+                if total_checked % 10 == 0:
+                    print(f"Progress: {total_checked} checked, {skipped} skipped, "
+                          f"{len(available_articles)} available")
+                
+                availability = check_article_availability(article_title)
+                
+                # Do not record titles whose check failed, so they are checked again
+                failed_langs = [lang for lang, exists in availability.items() if exists is None]
+                if failed_langs:
+                    print(f"  ⚠ Could not check: {', '.join(failed_langs)} - {article_title}")
+                    continue
                 
-                # Save progress periodically
-                if len(available_articles) % 50 == 0:
-                    save_availability_progress(available_articles, storage_dir)
-            else:
                 missing_langs = [lang for lang, exists in availability.items() if not exists]
-                print(f"  ✗ Missing in: {', '.join(missing_langs)} - {article_title}")
+                record_availability(state, article_title, missing_langs)
+                decided += 1
+                total_decided += 1
+                
+                # Check if article exists in ALL languages
+                if not missing_langs:
+                    available_articles.append(article_title)
+                    print(f"  ✓ [{len(available_articles)}/{limit}] {article_title}")
+                else:
+                    print(f"  ✗ Missing in: {', '.join(missing_langs)} - {article_title}")
+                
+                # Save progress periodically, counting only recorded titles
+                if total_decided % AVAILABILITY_SAVE_INTERVAL == 0:
+                    save_availability_progress(state, storage_dir)
+                
+                # Stop if we have enough articles
+                if len(available_articles) >= limit:
+                    print(f"\nReached target of {limit} articles available in all languages!")
+                    break
             
-            # Stop if we have enough articles
-            if len(available_articles) >= limit:
-                print(f"\nReached target of {limit} articles available in all languages!")
+            # Stop when a batch brings nothing new: the title source is exhausted
+            # (e.g. the fallback articles) or every check failed
+            if decided == 0 and len(available_articles) < limit:
+                print("No new articles could be checked in this batch, stopping.")
                 break
-        
-        # Stop if we have enough articles
-        if len(available_articles) >= limit:
-            break
+    finally:
+        # Keep the work done so far, even when interrupted
+        save_availability_progress(state, storage_dir)
     
     print(f"\nFinal result: {len(available_articles)} articles available in all languages")
-    return available_articles
+    return available_articles[:limit]
+
+def load_availability_state(storage_dir):
+    """
+    Loads the availability discovery state saved by save_availability_progress().
+
+    Accepted titles map to their check time. Rejected titles map to a single int
+    packing the check time and a bitmask of the missing languages (see
+    record_availability), which keeps hundreds of thousands of entries compact.
+
+    Returns:
+        dict: {"accepted": {title: timestamp}, "rejected": {title: packed int}}
+    """
+    state = {"accepted": {}, "rejected": {}}
+    progress_file = storage_dir / "availability_progress.json"
+    if not progress_file.exists():
+        return state
+
+    try:
+        with open(progress_file, 'r', encoding='utf-8') as f:
+            progress_data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Error loading availability progress: {e}")
+        return state
 
-def save_availability_progress(available_articles, storage_dir):
-    """Saves the current list of available articles for resume capability."""
+    if "accepted" in progress_data:
+        state["accepted"] = {title: int(checked_at) for title, checked_at in progress_data["accepted"]}
+    else:
+        # Older progress files only list the available articles
+        saved_at = int(time.time())
+        state["accepted"] = {title: saved_at for title in progress_data.get("available_articles", [])}
+
+    for title, missing_langs, checked_at in progress_data.get("rejected", []):
+        record_availability(state, title, missing_langs, checked_at)
+
+    return state
+
+def record_availability(state, article_title, missing_langs, checked_at=None):
+    """Records the result of an availability check in the discovery state."""
+    checked_at = int(checked_at if checked_at is not None else time.time())
+    if not missing_langs:
+        state["rejected"].pop(article_title, None)
+        state["accepted"][article_title] = checked_at
+        return
+
+    missing_mask = 0
+    for i, lang in enumerate(TARGET_LANGUAGES):
+        if lang in missing_langs:
+            missing_mask |= 1 << i
+    state["rejected"][article_title] = (checked_at << len(TARGET_LANGUAGES)) | missing_mask
+
+def is_cached_rejection(state, article_title):
+    """Returns True if the title was rejected less than NEGATIVE_CACHE_TTL seconds ago."""
+    packed = state["rejected"].get(article_title)
+    if packed is None:
+        return False
+    checked_at = packed >> len(TARGET_LANGUAGES)
+    return time.time() - checked_at < NEGATIVE_CACHE_TTL
+
+def save_availability_progress(state, storage_dir):
+    """Saves the availability discovery state for resume capability."""
     try:
         progress_file = storage_dir / "availability_progress.json"
-        with open(progress_file, 'w', encoding='utf-8') as f:
+        temp_file = progress_file.with_suffix('.tmp')
+        lang_count = len(TARGET_LANGUAGES)
+
+        rejected = []
+        for title, packed in state["rejected"].items():
+            missing_langs = [lang for i, lang in enumerate(TARGET_LANGUAGES) if packed & (1 << i)]
+            rejected.append([title, missing_langs, packed >> lang_count])
+
+        with open(temp_file, 'w', encoding='utf-8') as f:
             json.dump({
-                "available_articles": available_articles,
-                "count": len(available_articles),
+                "available_articles": list(state["accepted"]),
+                "count": len(state["accepted"]),
+                "accepted": [[title, checked_at] for title, checked_at in state["accepted"].items()],
+                "rejected": rejected,
                 "saved_at": time.strftime("%Y-%m-%d %H:%M:%S")
-            }, f, ensure_ascii=False, indent=2)
+            }, f, ensure_ascii=False)
+        os.replace(temp_file, progress_file)
     except Exception as e:
         print(f"Error saving availability progress: {e}")
 
+def get_dump_path(lang_code, table, dump_dir=DUMP_DIR):
+    """Returns the path of a Wikipedia SQL dump, e.g. dumps/enwiki-latest-page.sql.gz."""
+    return Path(dump_dir) / f"{lang_code}wiki-latest-{table}.sql.gz"
+
+def unescape_sql_string(value):
+    """Undoes the MySQL string escaping used in the SQL dumps."""
+    return re.sub(r'\\(.)', lambda m: SQL_ESCAPES.get(m.group(1), m.group(1)), value)
+
+def iter_sql_dump_rows(dump_file, table, row_pattern):
+    """
+    Streams an SQL dump and yields the rows matching a pattern.
+
+    Only the `INSERT INTO` lines of the given table are scanned, and only the
+    tuples matched by `row_pattern` are parsed, so the dump is never loaded
+    into memory.
+
+    Args:
+        dump_file (Path): Path to the dump (.sql or .sql.gz).
+        table (str): Name of the table, e.g. 'page' or 'langlinks'.
+        row_pattern (re.Pattern): Pattern matching a single row tuple.
+
+    Yields:
+        tuple: The groups captured by `row_pattern` for every matched row.
+    """
+    insert_prefix = f"INSERT INTO `{table}` VALUES "
+    opener = gzip.open if str(dump_file).endswith('.gz') else open
+
+    with opener(dump_file, 'rt', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if not line.startswith(insert_prefix):
+                continue
+            for match in row_pattern.finditer(line):
+                yield match.groups()
+
+def build_langlinks_index(dump_dir=DUMP_DIR, index_file=LANGLINKS_INDEX_FILE):
+    """
+    Builds an offline index of the English articles available in ALL target languages.
+
+    The English `langlinks` dump is streamed twice: first to collect, per target
+    language, the page IDs that link to it (kept as sorted NumPy arrays and
+    intersected), then to collect the target-language titles of the common IDs.
+    The English `page` dump gives the English titles. If the `page` dumps of the
+    target languages are present they are used to drop links to missing pages.
+
+    Args:
+        dump_dir (Path): Directory containing the SQL dumps.
+        index_file (Path): Where to save the binary index.
+
+    Returns:
+        dict: The index, as returned by load_langlinks_index(), or None on failure.
+    """
+    source_lang = TARGET_LANGUAGES[0]
+    other_langs = TARGET_LANGUAGES[1:]
+    langlinks_file = get_dump_path(source_lang, 'langlinks', dump_dir)
+    page_file = get_dump_path(source_lang, 'page', dump_dir)
+
+    for dump_file in (langlinks_file, page_file):
+        if not dump_file.exists():
+            print(f"Missing dump file: {dump_file}")
+            return None
+
+    langlinks_pattern = re.compile(
+        r"\((\d+),'(" + '|'.join(map(re.escape, other_langs)) + r")'," + SQL_STRING + r"\)"
+    )
+
+    # Pass 1: page IDs linking to each target language
+    print(f"Reading page IDs from {langlinks_file}...")
+    linked_ids = {lang: [] for lang in other_langs}
+    for page_id, lang, _ in iter_sql_dump_rows(langlinks_file, 'langlinks', langlinks_pattern):
+        linked_ids[lang].append(int(page_id))
+
+    common_ids = None
+    for lang in other_langs:
+        ids = np.unique(np.array(linked_ids.pop(lang), dtype=np.int64))
+        print(f"  {lang}: {len(ids):,} linked articles")
+        common_ids = ids if common_ids is None else np.intersect1d(common_ids, ids, assume_unique=True)
+    print(f"  {len(common_ids):,} articles linked to all of {', '.join(other_langs)}")
+
+    # Pass 2: titles of the common IDs in every language
+    print(f"Reading titles from {page_file}...")
+    wanted_ids = set(common_ids.tolist())
+    titles = {lang: {} for lang in TARGET_LANGUAGES}
+    for page_id, title in iter_sql_dump_rows(page_file, 'page', PAGE_ROW_PATTERN):
+        page_id = int(page_id)
+        if page_id in wanted_ids:
+            titles[source_lang][page_id] = unescape_sql_string(title).replace('_', ' ')
+
+    if len(common_ids) and not titles[source_lang]:
+        # PAGE_ROW_PATTERN expects page_is_redirect right after page_title; older
+        # dumps with a page_restrictions column in between match no rows at all
+        print(f"ERROR: No article titles found in {page_file} for {len(common_ids):,} linked pages.")
+        print("       The page dump probably uses an unsupported schema. The index was not saved.")
+        return None
+
+    print(f"Reading target titles from {langlinks_file}...")
+    for page_id, lang, title in iter_sql_dump_rows(langlinks_file, 'langlinks', langlinks_pattern):
+        page_id = int(page_id)
+        if page_id in wanted_ids and title:
+            titles[lang][page_id] = unescape_sql_string(title).replace('_', ' ')
+
+    # Optionally verify that the linked pages exist in the target languages
+    for lang in other_langs:
+        lang_page_file = get_dump_path(lang, 'page', dump_dir)
+        if not lang_page_file.exists():
+            continue
+        print(f"Verifying {lang} titles against {lang_page_file}...")
+        wanted_titles = {title.replace(' ', '_') for title in titles[lang].values()}
+        existing_titles = set()
+        for _, title in iter_sql_dump_rows(lang_page_file, 'page', PAGE_ROW_PATTERN):
+            title = unescape_sql_string(title)
+            if title in wanted_titles:
+                existing_titles.add(title)
+        titles[lang] = {page_id: title for page_id, title in titles[lang].items()
+                        if title.replace(' ', '_') in existing_titles}
+
+    # Keep only the IDs that have a title in every language
+    page_ids = np.array(
+        [page_id for page_id in common_ids.tolist()
+         if all(page_id in titles[lang] for lang in TARGET_LANGUAGES)],
+        dtype=np.int64
+    )
+
+    if not len(page_ids):
+        print("ERROR: No articles are available in all languages according to the dumps. "
+              "The index was not saved.")
+        return None
+
+    index = {
+        "page_ids": page_ids,
+        "titles": {lang: [titles[lang][page_id] for page_id in page_ids.tolist()]
+                   for lang in TARGET_LANGUAGES}
+    }
+    save_langlinks_index(index, index_file)
+    print(f"✓ Langlinks index with {len(page_ids):,} articles saved to {index_file}")
+    return index
+
+def save_langlinks_index(index, index_file=LANGLINKS_INDEX_FILE):
+    """
+    Saves the langlinks index as an uncompressed .npz file.
+
+    Titles are stored per language as one newline-separated UTF-8 buffer so the
+    whole index loads with a handful of reads.
+    """
+    index_file = Path(index_file)
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    arrays = {"page_ids": index["page_ids"]}
+    for lang, lang_titles in index["titles"].items():
+        arrays[f"titles_{lang}"] = np.frombuffer('\n'.join(lang_titles).encode('utf-8'), dtype=np.uint8)
+    with open(index_file, 'wb') as f:
+        np.savez(f, **arrays)
+
+def load_langlinks_index(index_file=LANGLINKS_INDEX_FILE):
+    """
+    Loads an index saved by build_langlinks_index().
+
+    Returns:
+        dict: {"page_ids": sorted int64 array, "titles": {lang_code: [title, ...]}},
+              with titles aligned to page_ids, or None if the index does not exist.
+    """
+    index_file = Path(index_file)
+    if not index_file.exists():
+        return None
+
+    with np.load(index_file) as data:
+        page_ids = data["page_ids"]
+        titles = {}
+        for lang in TARGET_LANGUAGES:
+            buffer = data[f"titles_{lang}"].tobytes().decode('utf-8')
+            titles[lang] = buffer.split('\n') if len(page_ids) else []
+
+    return {"page_ids": page_ids, "titles": titles}
+
+def is_langlinks_index_stale(index_file=LANGLINKS_INDEX_FILE, dump_dir=DUMP_DIR):
+    """Returns True if the index exists but one of the SQL dumps is newer than it."""
+    index_file = Path(index_file)
+    if not index_file.exists():
+        return False
+
+    dump_files = [get_dump_path(TARGET_LANGUAGES[0], 'langlinks', dump_dir)]
+    dump_files += [get_dump_path(lang, 'page', dump_dir) for lang in TARGET_LANGUAGES]
+    index_mtime = index_file.stat().st_mtime
+    return any(dump_file.exists() and dump_file.stat().st_mtime > index_mtime
+               for dump_file in dump_files)
+
+def get_articles_from_langlinks_index(limit=100, index_file=LANGLINKS_INDEX_FILE, dump_dir=DUMP_DIR):
+    """
+    Gets articles available in ALL target languages from the offline langlinks index.
+    Builds the index from the SQL dumps first if it is missing, empty, or older
+    than the dumps.
+
+    Args:
+        limit (int): Number of articles to retrieve.
+        index_file (Path): Path of the binary index.
+        dump_dir (Path): Directory containing the SQL dumps.
+
+    Returns:
+        tuple: (list of English titles, dict mapping each English title to its
+               per-language titles), or (None, None) if no index is available.
+    """
+    index = None
+    if is_langlinks_index_stale(index_file, dump_dir):
+        print("Langlinks index is older than the SQL dumps, rebuilding it...")
+    else:
+        index = load_langlinks_index(index_file)
+    if not index or not len(index["page_ids"]):
+        if index is not None:
+            print("Langlinks index is empty, rebuilding it from the SQL dumps...")
+        elif not Path(index_file).exists():
+            print("No langlinks index found, building it from the SQL dumps...")
+        index = build_langlinks_index(dump_dir, index_file)
+        if index is None:
+            return None, None
+
+    source_lang = TARGET_LANGUAGES[0]
+    master_articles = index["titles"][source_lang][:limit]
+    master_titles = {
+        title: {lang: index["titles"][lang][i] for lang in TARGET_LANGUAGES}
+        for i, title in enumerate(master_articles)
+    }
+    print(f"Loaded {len(master_articles)} articles from langlinks index ({len(index['page_ids']):,} available)")
+    return master_articles, master_titles
+
+def fetch_page_info(lang_code, titles):
+    """
+    Queries the length and page properties of up to API_BATCH_SIZE titles in one call.
+
+    Args:
+        lang_code (str): The language code for Wikipedia.
+        titles (list): The titles to query.
+
+    Returns:
+        dict: Maps each requested title to {"missing", "length", "pageprops"},
+              or None if the query failed.
+    """
+    url = f"https://{lang_code}.wikipedia.org/w/api.php"
+    params = {
+        'action': 'query',
+        'prop': 'info|pageprops',
+        'titles': '|'.join(titles),
+        'redirects': 1,
+        'format': 'json',
+        'formatversion': 2,
+    }
+
+    # Headers to identify as a legitimate bot
+    headers = {
+        'User-Agent': 'WikipediaExtractor/1.0 (https://github.com/your-repo; your-email@example.com) Python/3.12',
+        'Accept': 'application/json',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+    }
+
+    try:
+        response = requests.get(url, params=params, headers=headers, timeout=15)
+        response.raise_for_status()
+        query = response.json().get('query', {})
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"    Error querying page info on {lang_code}: {e}")
+        return None
+
+    # Follow title normalization and redirects back to the requested titles
+    renames = {}
+    for mapping in query.get('normalized', []) + query.get('redirects', []):
+        renames[mapping['from']] = mapping['to']
+    pages = {page['title']: page for page in query.get('pages', [])}
+
+    page_info = {}
+    for title in titles:
+        resolved = title
+        seen = set()
+        while resolved in renames and resolved not in seen:
+            seen.add(resolved)
+            resolved = renames[resolved]
+        page = pages.get(resolved, {'missing': True})
+        page_info[title] = {
+            "missing": bool(page.get('missing') or page.get('invalid')),
+            "length": page.get('length', 0),
+            "pageprops": page.get('pageprops', {})
+        }
+    return page_info
+
+def get_rejection_reason(lang_code, info):
+    """Returns why a page fails the pre-fetch thresholds, or None if it passes."""
+    if info["missing"]:
+        return "missing"
+    if info["length"] < MIN_ARTICLE_BYTES.get(lang_code, 0):
+        return "too_short"
+    if REJECTED_PAGE_PROPS & set(info["pageprops"]):
+        return "low_quality"
+    return None
+
+def prefilter_articles(master_articles, master_titles, storage_dir):
+    """
+    Rejects articles that are missing, stubs, or non-articles in any target language,
+    using page metadata only (no HTML is downloaded).
+
+    Decisions and per-language rejection statistics are saved to
+    prefilter_stats.json while the titles are checked, so already decided titles
+    are not queried again as long as the thresholds stay the same. Titles whose queries failed are kept for this run but
+    not saved, so they are checked again next time.
+
+    Args:
+        master_articles (list): Master article titles.
+        master_titles (dict): Per-language titles of the master articles, if known.
+        storage_dir (Path): Storage directory.
+
+    Returns:
+        list: The master articles that pass the thresholds in ALL target languages.
+    """
+    stats_file = storage_dir / "prefilter_stats.json"
+    results = {"accepted": [], "rejected": {}}
+    if stats_file.exists():
+        try:
+            with open(stats_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            # Decisions made with other thresholds are not reused
+            if saved.get("thresholds") == get_prefilter_thresholds():
+                results["accepted"] = saved.get("accepted", [])
+                results["rejected"] = saved.get("rejected", {})
+            else:
+                print("Pre-filter thresholds changed since the last run, checking all articles again")
+        except (OSError, ValueError) as e:
+            print(f"Error loading prefilter results: {e}")
+
+    accepted = set(results["accepted"])
+    to_check = [title for title in master_articles
+                if title not in accepted and title not in results["rejected"]]
+    print(f"Pre-filtering {len(to_check)} articles ({len(master_articles) - len(to_check)} already checked)...")
+
+    undecided = set()
+    try:
+        for chunk_num, start in enumerate(range(0, len(to_check), API_BATCH_SIZE), 1):
+            chunk = to_check[start:start + API_BATCH_SIZE]
+            reasons = {title: {} for title in chunk}
+            failed_langs = []
+
+            for lang_code in TARGET_LANGUAGES:
+                batch = [master_titles.get(title, {}).get(lang_code, title) for title in chunk]
+                page_info = fetch_page_info(lang_code, batch)
+                time.sleep(0.5)  # Rate limiting
+                if page_info is None:
+                    failed_langs.append(lang_code)
+                    continue
+
+                for title, lang_title in zip(chunk, batch):
+                    reason = get_rejection_reason(lang_code, page_info[lang_title])
+                    if reason:
+                        reasons[title][lang_code] = reason
+
+            for title in chunk:
+                if reasons[title]:
+                    results["rejected"][title] = reasons[title]
+                    print(f"  ✗ {title}: {', '.join(f'{lang} {reason}' for lang, reason in reasons[title].items())}")
+                elif failed_langs:
+                    # Keep the article rather than reject it on a failed query,
+                    # but do not record it so the next run checks it again
+                    undecided.add(title)
+                else:
+                    results["accepted"].append(title)
+                    accepted.add(title)
+
+            if failed_langs:
+                print(f"  ⚠ Could not check {', '.join(failed_langs)} for {len(chunk)} articles")
+
+            # Save progress periodically
+            if chunk_num % PREFILTER_SAVE_INTERVAL == 0:
+                save_prefilter_results(results, stats_file)
+    finally:
+        # Keep the work done so far, even when interrupted
+        statistics = save_prefilter_results(results, stats_file)
+
+    for lang_code in TARGET_LANGUAGES:
+        lang_stats = statistics[lang_code]
+        print(f"  {lang_code}: {lang_stats['missing']} missing, {lang_stats['too_short']} too short, "
+              f"{lang_stats['low_quality']} low quality")
+
+    filtered_articles = [title for title in master_articles if title in accepted or title in undecided]
+    print(f"✓ {len(filtered_articles)}/{len(master_articles)} articles passed the pre-fetch filter"
+          f" ({len(undecided)} unchecked because of failed queries)")
+    return filtered_articles
+
+def get_prefilter_thresholds():
+    """Returns the current pre-fetch filter thresholds, as saved with the decisions."""
+    return {
+        "min_bytes": dict(MIN_ARTICLE_BYTES),
+        "rejected_page_props": sorted(REJECTED_PAGE_PROPS)
+    }
+
+def save_prefilter_results(results, stats_file):
+    """
+    Saves the pre-fetch filter decisions and per-language rejection statistics.
+
+    Returns:
+        dict: The rejection counts per language and reason.
+    """
+    # Per-language rejection statistics over every checked title
+    statistics = {lang: {"missing": 0, "too_short": 0, "low_quality": 0} for lang in TARGET_LANGUAGES}
+    for lang_reasons in results["rejected"].values():
+        for lang_code, reason in lang_reasons.items():
+            statistics[lang_code][reason] += 1
+
+    try:
+        temp_file = stats_file.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                "thresholds": get_prefilter_thresholds(),
+                "accepted_count": len(results["accepted"]),
+                "rejected_count": len(results["rejected"]),
+                "rejections_by_language": statistics,
+                "accepted": results["accepted"],
+                "rejected": results["rejected"],
+                "saved_at": time.strftime("%Y-%m-%d %H:%M:%S")
+            }, f, ensure_ascii=False, indent=2)
+        os.replace(temp_file, stats_file)
+    except Exception as e:
+        print(f"Error saving prefilter statistics: {e}")
+
+    return statistics
+
 def get_known_common_articles():
     """
     Returns a list of articles that are likely to exist in all target languages.
@@ -563,21 +1348,283 @@ def save_progress(lang_code, progress_data, storage_dir):
     except Exception as e:
         print(f"Error saving progress for {lang_code}: {e}")
 
-def translate_text(text, from_lang, to_lang):
+def translators_backend(segments, from_lang, to_lang):
     """
-    Placeholder for translation functionality.
-    Translation is not used in bulk extraction mode.
-    
+    Translates a batch of segments with the translators package in a single call.
+
+    Args:
+        segments (list): Segments to translate (without newlines).
+        from_lang (str): The source language code.
+        to_lang (str): The target language code.
+
+    Returns:
+        list: The translated segments, in the same order.
+    """
+    # Imported here because importing translators contacts the translation services
+    import translators as ts
+
+    translated = ts.translate_text('\n'.join(segments), translator=TRANSLATOR_SERVICE,
+                                   from_language=from_lang, to_language=to_lang)
+    parts = translated.split('\n')
+    if len(parts) == len(segments):
+        return parts
+
+    # The service merged or split lines; translate the segments one by one instead,
+    # still keeping TRANSLATION_MIN_INTERVAL between the calls
+    translated_segments = []
+    for segment in segments:
+        wait_for_rate_limit()
+        translated_segments.append(ts.translate_text(segment, translator=TRANSLATOR_SERVICE,
+                                                     from_language=from_lang, to_language=to_lang))
+    return translated_segments
+
+def local_backend(segments, from_lang, to_lang):
+    """
+    Deterministic offline stand-in for a translation service, for tests and benchmarks.
+    Marks each segment with the language pair instead of translating it.
+    """
+    return [f"[{from_lang}>{to_lang}] {segment}" for segment in segments]
+
+# Available translation backends; any callable with the same signature can also
+# be used, together with a name identifying it in the translation cache
+TRANSLATION_BACKENDS = {
+    'translators': translators_backend,
+    'local': local_backend,
+}
+
+# One SQLite connection per thread and cache file, since connections cannot be shared
+_translation_cache = threading.local()
+_rate_limit_lock = threading.Lock()
+_last_backend_call = [0.0]
+
+def open_translation_cache(cache_file=None):
+    """
+    Opens the segment translation cache, an SQLite table keyed by segment hash.
+    New translations are inserted as they come, so saving never rewrites the cache.
+
+    Args:
+        cache_file (Path): The cache database. Defaults to TRANSLATION_CACHE_FILE.
+
+    Returns:
+        sqlite3.Connection: The connection of the current thread to the cache.
+    """
+    cache_file = Path(cache_file or TRANSLATION_CACHE_FILE).resolve()
+    if not hasattr(_translation_cache, 'connections'):
+        _translation_cache.connections = {}
+
+    connection = _translation_cache.connections.get(cache_file)
+    if connection is None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(cache_file)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS segments (key TEXT PRIMARY KEY, translation TEXT NOT NULL)"
+        )
+        connection.commit()
+        _translation_cache.connections[cache_file] = connection
+    return connection
+
+def get_cached_translations(keys, cache_file=None):
+    """
+    Returns the cached translations of the given segment keys, as {key: translation}.
+    If the cache cannot be read, the keys are treated as cache misses.
+    """
+    keys = list(keys)
+    cached = {}
+    try:
+        cache = open_translation_cache(cache_file)
+        # Stay below SQLite's limit on the number of query parameters
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            cached.update(cache.execute(
+                f"SELECT key, translation FROM segments WHERE key IN ({placeholders})", chunk
+            ))
+    except (sqlite3.Error, OSError) as e:
+        print(f"Error reading translation cache: {e}")
+    return cached
+
+def save_translations(translations, cache_file=None):
+    """Adds translations, given as {key: translation}, to the translation cache."""
+    try:
+        cache = open_translation_cache(cache_file)
+        cache.executemany("INSERT OR REPLACE INTO segments (key, translation) VALUES (?, ?)",
+                          translations.items())
+        cache.commit()
+    except (sqlite3.Error, OSError) as e:
+        print(f"Error saving translation cache: {e}")
+
+def get_backend_cache_id(backend_name):
+    """Returns the id of a backend in cache keys, including the translators service."""
+    if backend_name == 'translators':
+        return f"translators:{TRANSLATOR_SERVICE}"
+    return backend_name
+
+def get_segment_key(segment, from_lang, to_lang, backend_id):
+    """Returns the cache key of a segment for a language pair and backend."""
+    return hashlib.sha1(f"{backend_id}|{from_lang}|{to_lang}|{segment}".encode('utf-8')).hexdigest()
+
+def split_into_segments(text):
+    """
+    Splits text into sentence segments no longer than MAX_BATCH_CHARS.
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        list: The segments; joining them with spaces gives back the normalized text.
+    """
+    sentences = re.split(r'(?<=[.!?])\s+', re.sub(r'\s+', ' ', text).strip())
+
+    segments = []
+    for sentence in sentences:
+        if not sentence:
+            continue
+        # Split overly long sentences on word boundaries
+        while len(sentence) > MAX_BATCH_CHARS:
+            cut = sentence.rfind(' ', 0, MAX_BATCH_CHARS)
+            if cut <= 0:
+                cut = MAX_BATCH_CHARS
+            segments.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        if sentence:
+            segments.append(sentence)
+    return segments
+
+def batch_segments(segments):
+    """Groups segments into batches within MAX_BATCH_CHARS and MAX_BATCH_SEGMENTS."""
+    batches = []
+    batch = []
+    batch_chars = 0
+    for segment in segments:
+        if batch and (batch_chars + len(segment) > MAX_BATCH_CHARS or len(batch) >= MAX_BATCH_SEGMENTS):
+            batches.append(batch)
+            batch = []
+            batch_chars = 0
+        batch.append(segment)
+        batch_chars += len(segment) + 1  # Separator
+    if batch:
+        batches.append(batch)
+    return batches
+
+def wait_for_rate_limit():
+    """Waits until TRANSLATION_MIN_INTERVAL has passed since the last translation request."""
+    with _rate_limit_lock:
+        wait = _last_backend_call[0] + TRANSLATION_MIN_INTERVAL - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _last_backend_call[0] = time.monotonic()
+
+def call_translation_backend(backend, batch, from_lang, to_lang):
+    """Calls a translation backend, keeping at least TRANSLATION_MIN_INTERVAL between calls."""
+    wait_for_rate_limit()
+
+    try:
+        translated = backend(batch, from_lang, to_lang)
+        if len(translated) != len(batch):
+            raise ValueError(f"expected {len(batch)} segments, got {len(translated)}")
+        return translated
+    except Exception as e:
+        print(f"Error translating batch of {len(batch)} segments: {e}")
+        return None
+
+def translate_text(text, from_lang, to_lang, backend=None, backend_name=None):
+    """
+    Translates text by batching its segments per backend call.
+
+    Segments are memoized in a persistent cache, so repeated sentences are only
+    translated once. Uncached batches are sent concurrently, rate limited.
+    Segments whose batch fails are kept untranslated (and not cached).
+
     Args:
         text (str): The text to translate.
         from_lang (str): The source language code.
         to_lang (str): The target language code.
+        backend (str or callable): A name from TRANSLATION_BACKENDS or a callable
+            taking (segments, from_lang, to_lang). Defaults to TRANSLATION_BACKEND.
+        backend_name (str): Stable name of a callable backend, used in the cache
+            keys. Required when `backend` is a callable.
+
+    Returns:
+        str: The translated text.
+    """
+    if not text or from_lang == to_lang:
+        return text
+
+    backend = backend or TRANSLATION_BACKEND
+    if isinstance(backend, str):
+        backend_name = backend
+        backend = TRANSLATION_BACKENDS[backend]
+    elif not backend_name:
+        raise ValueError("backend_name is required for callable translation backends")
+    backend_id = get_backend_cache_id(backend_name)
+
+    segments = split_into_segments(text)
+    keys = [get_segment_key(segment, from_lang, to_lang, backend_id) for segment in segments]
+    cached = get_cached_translations(set(keys))
+    from_cache = sum(1 for key in keys if key in cached)
+
+    # Only translate each uncached segment once
+    pending = {}
+    for segment, key in zip(segments, keys):
+        if key not in cached and key not in pending:
+            pending[key] = segment
+
+    if pending:
+        batches = batch_segments(list(pending.values()))
+        new_translations = {}
+        with ThreadPoolExecutor(max_workers=TRANSLATION_WORKERS) as executor:
+            results = executor.map(lambda batch: call_translation_backend(backend, batch, from_lang, to_lang),
+                                   batches)
+            for batch, translated in zip(batches, results):
+                if translated is None:
+                    continue
+                for segment, translated_segment in zip(batch, translated):
+                    new_translations[get_segment_key(segment, from_lang, to_lang, backend_id)] = translated_segment
+        if new_translations:
+            save_translations(new_translations)
+            cached.update(new_translations)
+        print(f"Translated {len(new_translations)}/{len(pending)} new segments in {len(batches)} calls "
+              f"({from_cache} from cache)")
+
+    return ' '.join(cached.get(key, segment) for segment, key in zip(segments, keys))
+
+def save_master_articles(master_articles, master_titles, storage_dir):
+    """Saves the master article list and, if known, the per-language titles."""
+    with open(storage_dir / "master_articles.json", 'w', encoding='utf-8') as f:
+        json.dump(master_articles, f, ensure_ascii=False, indent=2)
+    print(f"Saved {len(master_articles)} articles to master list")
+    if master_titles:
+        with open(storage_dir / "master_titles.json", 'w', encoding='utf-8') as f:
+            json.dump(master_titles, f, ensure_ascii=False, indent=2)
+
+def get_more_master_articles(master_articles, master_titles, count, storage_dir):
+    """
+    Gets candidate articles that are not yet in the master list, from the langlinks
+    index when it was the source of the master list, or from availability discovery.
+
+    Args:
+        master_articles (list): Current master article titles.
+        master_titles (dict): Per-language titles of the master articles, if known.
+        count (int): Number of new articles wanted.
+        storage_dir (Path): Storage directory.
 
     Returns:
-        str: The original text (no translation performed).
+        tuple: (list of up to `count` new titles, dict of their per-language titles)
     """
-    print(f"Translation not performed in bulk extraction mode.")
-    return text
+    if USE_KNOWN_ARTICLES:
+        return [], {}
+
+    known = set(master_articles)
+    wanted = len(master_articles) + count
+
+    if USE_LANGLINKS_INDEX and (master_titles or not master_articles):
+        candidates, candidate_titles = get_articles_from_langlinks_index(wanted)
+        if candidates:
+            new_articles = [title for title in candidates if title not in known][:count]
+            return new_articles, {title: candidate_titles[title] for title in new_articles}
+
+    candidates = get_articles_with_availability_check(wanted, storage_dir)
+    return [title for title in candidates if title not in known][:count], {}
 
 def bulk_extract_articles():
     """
@@ -608,36 +1655,47 @@ def bulk_extract_articles():
     
     # Check if we already have a master list of articles
     master_articles_file = storage_dir / "master_articles.json"
+    master_titles_file = storage_dir / "master_titles.json"
+    master_titles = {}
     if master_articles_file.exists():
         print("Loading existing master article list...")
         with open(master_articles_file, 'r', encoding='utf-8') as f:
             master_articles = json.load(f)
         print(f"Loaded {len(master_articles)} existing articles")
+        if master_titles_file.exists():
+            with open(master_titles_file, 'r', encoding='utf-8') as f:
+                master_titles = json.load(f)
+
+        # A previous discovery run may have stopped short of the target, resume it
+        shortfall = ARTICLES_PER_LANGUAGE - len(master_articles)
+        if shortfall > 0 and not USE_KNOWN_ARTICLES:
+            print(f"Master list is {shortfall} articles short of the target, resuming discovery...")
+            new_articles, new_titles = get_more_master_articles(master_articles, master_titles,
+                                                                shortfall, storage_dir)
+            if new_articles:
+                master_articles = master_articles + new_articles
+                master_titles.update(new_titles)
+                save_master_articles(master_articles, master_titles, storage_dir)
     else:
         print("Creating new master article list with availability check...")
         
-        # Check if we have partial availability progress
-        availability_progress_file = storage_dir / "availability_progress.json"
-        if availability_progress_file.exists():
-            print("Found existing availability progress, resuming...")
-            with open(availability_progress_file, 'r', encoding='utf-8') as f:
-                progress_data = json.load(f)
-                existing_articles = progress_data.get("available_articles", [])
-                print(f"Resuming with {len(existing_articles)} existing articles")
-        
         if USE_KNOWN_ARTICLES:
             print("Using known common articles for testing...")
             known_articles = get_known_common_articles()
             master_articles = known_articles[:ARTICLES_PER_LANGUAGE]
             print(f"Selected {len(master_articles)} known articles: {master_articles}")
         else:
-            master_articles = get_articles_with_availability_check(ARTICLES_PER_LANGUAGE)
+            master_articles = None
+            if USE_LANGLINKS_INDEX:
+                print("Using offline langlinks index...")
+                master_articles, master_titles = get_articles_from_langlinks_index(ARTICLES_PER_LANGUAGE)
+            if not master_articles:
+                master_titles = {}
+                master_articles = get_articles_with_availability_check(ARTICLES_PER_LANGUAGE, storage_dir)
         
         if master_articles:
             # Save the master list
-            with open(master_articles_file, 'w', encoding='utf-8') as f:
-                json.dump(master_articles, f, ensure_ascii=False, indent=2)
-            print(f"Saved {len(master_articles)} articles to master list")
+            save_master_articles(master_articles, master_titles, storage_dir)
         else:
             print("ERROR: Could not find any articles available in all languages!")
             return
@@ -648,11 +1706,38 @@ def bulk_extract_articles():
 
     print(f"Master article list: {master_articles[:5]}...")  # Show first 5
 
+    # Reject stubs and non-articles before downloading any HTML
+    articles_to_extract = master_articles
+    if PREFILTER_ARTICLES:
+        print(f"\n--- Pre-filtering articles by page metadata ---")
+        articles_to_extract = prefilter_articles(master_articles, master_titles, storage_dir)
+
+        # Replace rejected articles so the target number of parallel articles is kept
+        while len(articles_to_extract) < ARTICLES_PER_LANGUAGE:
+            shortfall = ARTICLES_PER_LANGUAGE - len(articles_to_extract)
+            print(f"\nLooking for {shortfall} more articles to replace rejected ones...")
+            new_articles, new_titles = get_more_master_articles(master_articles, master_titles,
+                                                                shortfall, storage_dir)
+            if not new_articles:
+                print("No more candidate articles available")
+                break
+            master_articles = master_articles + new_articles
+            master_titles.update(new_titles)
+            save_master_articles(master_articles, master_titles, storage_dir)
+            articles_to_extract = prefilter_articles(master_articles, master_titles, storage_dir)
+
+        if not articles_to_extract:
+            print("ERROR: No articles passed the pre-fetch filter!")
+            return
+
+    # Positions in master_articles.json, kept for the extracted files when filtering
+    master_indexes = {title: i for i, title in enumerate(master_articles)}
+
     # Step 2: Extract each article from all languages
     print(f"\n--- Step 2: Extracting articles from all languages ---")
     
-    for i, article_title in enumerate(master_articles):
-        print(f"\n--- Processing Article {i+1}/{len(master_articles)}: '{article_title}' ---")
+    for i, article_title in enumerate(articles_to_extract):
+        print(f"\n--- Processing Article {i+1}/{len(articles_to_extract)}: '{article_title}' ---")
         
         for lang_code in TARGET_LANGUAGES:
             print(f"  Extracting from {LANG_NAMES[lang_code].capitalize()} ({lang_code})...")
@@ -666,8 +1751,14 @@ def bulk_extract_articles():
                 print(f"    ✓ Already completed")
                 continue
             
+            # Use the language-specific title when known (e.g. from the langlinks index)
+            lang_title = master_titles.get(article_title, {}).get(lang_code, article_title)
+            
             # Scrape the article
-            article_text = scrape_wikipedia_article(lang_code, article_title)
+            if STREAMING_EXTRACTION:
+                article_text = scrape_wikipedia_article_streaming(lang_code, lang_title)
+            else:
+                article_text = scrape_wikipedia_article(lang_code, lang_title)
             
             if article_text:
                 # Prepare article data
@@ -676,9 +1767,9 @@ def bulk_extract_articles():
                     "language": lang_code,
                     "language_name": LANG_NAMES[lang_code],
                     "content": article_text,
-                    "url": f"https://{lang_code}.wikipedia.org/wiki/{article_title.replace(' ', '_')}",
+                    "url": f"https://{lang_code}.wikipedia.org/wiki/{lang_title.replace(' ', '_')}",
                     "extracted_at": time.strftime("%Y-%m-%d %H:%M:%S"),
-                    "master_article_index": i
+                    "master_article_index": master_indexes[article_title]
                 }
                 
                 # Save the article
@@ -708,7 +1799,7 @@ def bulk_extract_articles():
             # Rate limiting
             time.sleep(1)
         
-        print(f"  Completed article {i+1}/{len(master_articles)} across all languages")
+        print(f"  Completed article {i+1}/{len(articles_to_extract)} across all languages")
 
     # Print final statistics
     print("\n" + "=" * 50)
@@ -737,7 +1828,7 @@ def bulk_extract_articles():
     print(f"\nArticles saved in: {storage_dir}/")
     
     # Create summary report
-    create_summary_report(storage_dir, master_articles)
+    create_summary_report(storage_dir, articles_to_extract)
 
 def main():
     """
@@ -0,0 +1,89 @@
+"""
+Checks the availability discovery state: saving and loading, the negative cache
+TTL, and that failed checks are neither recorded nor counted, without network
+access.
+"""
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main
+
+NOW = 1_700_000_000
+
+
+def test_state_round_trip(tmp_path):
+    state = {"accepted": {}, "rejected": {}}
+    main.record_availability(state, 'Water', [], NOW)
+    main.record_availability(state, 'Stub', ['ilo', 'ceb'], NOW - 5)
+    main.save_availability_progress(state, tmp_path)
+
+    loaded = main.load_availability_state(tmp_path)
+    assert loaded == state
+    assert loaded["rejected"]['Stub'] >> len(main.TARGET_LANGUAGES) == NOW - 5
+
+    saved = json.loads((tmp_path / "availability_progress.json").read_text(encoding='utf-8'))
+    assert saved["available_articles"] == ['Water']
+    assert saved["rejected"] == [['Stub', ['ilo', 'ceb'], NOW - 5]]
+
+
+def test_accepting_a_rejected_title_clears_the_rejection():
+    state = {"accepted": {}, "rejected": {}}
+    main.record_availability(state, 'Water', ['tl'], NOW)
+    main.record_availability(state, 'Water', [], NOW + 1)
+    assert state == {"accepted": {'Water': NOW + 1}, "rejected": {}}
+
+
+def test_legacy_progress_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(main.time, 'time', lambda: NOW)
+    (tmp_path / "availability_progress.json").write_text(
+        json.dumps({"available_articles": ['Water', 'Sun'], "count": 2}), encoding='utf-8'
+    )
+    assert main.load_availability_state(tmp_path) == {
+        "accepted": {'Water': NOW, 'Sun': NOW}, "rejected": {}
+    }
+
+
+def test_negative_cache_ttl_boundary(monkeypatch):
+    state = {"accepted": {}, "rejected": {}}
+    main.record_availability(state, 'Stub', ['tl'], NOW)
+    assert not main.is_cached_rejection(state, 'Unknown')
+
+    monkeypatch.setattr(main.time, 'time', lambda: NOW + main.NEGATIVE_CACHE_TTL - 1)
+    assert main.is_cached_rejection(state, 'Stub')
+    monkeypatch.setattr(main.time, 'time', lambda: NOW + main.NEGATIVE_CACHE_TTL)
+    assert not main.is_cached_rejection(state, 'Stub')
+
+
+def test_failed_checks_are_not_recorded(tmp_path, monkeypatch):
+    results = {
+        'Water': {lang: True for lang in main.TARGET_LANGUAGES},
+        'Stub': {lang: lang != 'ceb' for lang in main.TARGET_LANGUAGES},
+        'Flaky': {lang: None if lang == 'ilo' else True for lang in main.TARGET_LANGUAGES},
+    }
+    monkeypatch.setattr(main, 'get_wikipedia_articles', lambda lang_code, limit: list(results))
+    monkeypatch.setattr(main, 'check_article_availability', lambda title: results[title])
+
+    assert main.get_articles_with_availability_check(5, tmp_path) == ['Water']
+
+    state = main.load_availability_state(tmp_path)
+    assert list(state["accepted"]) == ['Water']
+    assert list(state["rejected"]) == ['Stub']
+
+
+def test_save_interval_counts_decided_titles(tmp_path, monkeypatch):
+    titles = ['Flaky', 'A', 'B', 'C', 'D']
+    monkeypatch.setattr(main, 'AVAILABILITY_SAVE_INTERVAL', 2)
+    monkeypatch.setattr(main, 'get_wikipedia_articles', lambda lang_code, limit: titles)
+    monkeypatch.setattr(main, 'check_article_availability',
+                        lambda title: {lang: None if title == 'Flaky' else True
+                                       for lang in main.TARGET_LANGUAGES})
+    saves = []
+    monkeypatch.setattr(main, 'save_availability_progress',
+                        lambda state, storage_dir: saves.append(list(state["accepted"])))
+
+    main.get_articles_with_availability_check(4, tmp_path)
+    # Every second decided title, then once more at the end
+    assert saves == [['A', 'B'], ['A', 'B', 'C', 'D'], ['A', 'B', 'C', 'D']]
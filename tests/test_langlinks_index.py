@@ -0,0 +1,136 @@
+"""
+Builds the langlinks index from small SQL dumps and checks the parsing helpers
+and the save/load round-trip.
+"""
+import gzip
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main
+
+EN_LANGLINKS = (
+    "-- MySQL dump\n"
+    "INSERT INTO `langlinks` VALUES "
+    "(1,'de','Wasser'),(1,'tl','Tubig'),(1,'ilo','Danum'),(1,'ceb','Tubig'),"
+    "(2,'tl','Bato'),(2,'ilo','Bato'),"
+    "(3,'tl','Rock \\'n\\' roll'),(3,'ilo','Rock \\'n\\' roll'),(3,'ceb','Rock_and_roll'),"
+    "(4,'tl','Araw'),(4,'ilo','Init'),(4,'ceb','Adlaw'),"
+    "(5,'tl','Usapan'),(5,'ilo','Usapan'),(5,'ceb','Usapan');\n"
+    "INSERT INTO `langlinks` VALUES (6,'tl','Buwan'),(6,'ilo','Bulan'),(6,'ceb','Bulan');\n"
+)
+# Columns: page_id, page_namespace, page_title, page_is_redirect, page_is_new, ...
+EN_PAGE = (
+    "INSERT INTO `page` VALUES "
+    "(1,0,'Water',0,0,0.5,'20240101000000',NULL,10,100,'wikitext',NULL),"
+    "(3,0,'Rock_\\'n\\'_roll',0,0,0.1,'20240101000000',NULL,11,100,'wikitext',NULL),"
+    "(4,0,'Sun_(star)',1,0,0.2,'20240101000000',NULL,12,100,'wikitext',NULL),"
+    "(5,1,'Talk_page',0,0,0.3,'20240101000000',NULL,13,100,'wikitext',NULL),"
+    "(6,0,'Moon',0,0,0.4,'20240101000000',NULL,14,100,'wikitext',NULL);\n"
+)
+# Older schema with page_restrictions between page_title and page_is_redirect
+EN_PAGE_OLD_SCHEMA = (
+    "INSERT INTO `page` VALUES "
+    "(1,0,'Water','',0,0,0.5,'20240101000000',NULL,10,100,'wikitext',NULL),"
+    "(6,0,'Moon','',0,0,0.4,'20240101000000',NULL,14,100,'wikitext',NULL);\n"
+)
+CEB_PAGE = (
+    "INSERT INTO `page` VALUES "
+    "(10,0,'Tubig',0,0,0.5,'20240101000000',NULL,1,100,'wikitext',NULL),"
+    "(11,0,'Rock_and_roll',0,0,0.5,'20240101000000',NULL,1,100,'wikitext',NULL),"
+    "(12,0,'Bulan',1,0,0.5,'20240101000000',NULL,1,100,'wikitext',NULL);\n"
+)
+
+
+def write_dump(path, content):
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        f.write(content)
+
+
+def write_dumps(dump_dir, page=EN_PAGE, ceb_page=None):
+    dump_dir.mkdir(exist_ok=True)
+    write_dump(main.get_dump_path('en', 'langlinks', dump_dir), EN_LANGLINKS)
+    write_dump(main.get_dump_path('en', 'page', dump_dir), page)
+    if ceb_page is not None:
+        write_dump(main.get_dump_path('ceb', 'page', dump_dir), ceb_page)
+
+
+def test_unescape_sql_string():
+    assert main.unescape_sql_string("Rock_\\'n\\'_roll") == "Rock_'n'_roll"
+    assert main.unescape_sql_string('a\\\\b\\"c\\nd') == 'a\\b"c\nd'
+
+
+def test_iter_sql_dump_rows_only_reads_matching_rows(tmp_path):
+    dump_file = tmp_path / "page.sql"
+    dump_file.write_text(
+        "INSERT INTO `other` VALUES (7,0,'Other',0,0);\n" + EN_PAGE, encoding='utf-8'
+    )
+    rows = list(main.iter_sql_dump_rows(dump_file, 'page', main.PAGE_ROW_PATTERN))
+    # Redirects (4) and other namespaces (5) are skipped
+    assert rows == [('1', 'Water'), ('3', "Rock_\\'n\\'_roll"), ('6', 'Moon')]
+
+
+def test_build_save_and_load_index(tmp_path):
+    dump_dir = tmp_path / "dumps"
+    index_file = tmp_path / "index.npz"
+    write_dumps(dump_dir)
+
+    index = main.build_langlinks_index(dump_dir, index_file)
+    assert index["page_ids"].tolist() == [1, 3, 6]
+    assert index["titles"] == {
+        'en': ['Water', "Rock 'n' roll", 'Moon'],
+        'tl': ['Tubig', "Rock 'n' roll", 'Buwan'],
+        'ilo': ['Danum', "Rock 'n' roll", 'Bulan'],
+        'ceb': ['Tubig', 'Rock and roll', 'Bulan'],
+    }
+
+    loaded = main.load_langlinks_index(index_file)
+    assert loaded["page_ids"].dtype == np.int64
+    assert loaded["page_ids"].tolist() == index["page_ids"].tolist()
+    assert loaded["titles"] == index["titles"]
+
+
+def test_target_page_dump_drops_missing_and_redirect_targets(tmp_path):
+    dump_dir = tmp_path / "dumps"
+    write_dumps(dump_dir, ceb_page=CEB_PAGE)
+
+    index = main.build_langlinks_index(dump_dir, tmp_path / "index.npz")
+    # ceb:Bulan is only a redirect, so Moon is dropped
+    assert index["titles"]['en'] == ['Water', "Rock 'n' roll"]
+
+
+def test_unsupported_page_schema_is_not_saved(tmp_path):
+    dump_dir = tmp_path / "dumps"
+    index_file = tmp_path / "index.npz"
+    write_dumps(dump_dir, page=EN_PAGE_OLD_SCHEMA)
+
+    assert main.build_langlinks_index(dump_dir, index_file) is None
+    assert not index_file.exists()
+
+
+def test_index_is_rebuilt_when_dumps_are_newer(tmp_path):
+    dump_dir = tmp_path / "dumps"
+    index_file = tmp_path / "index.npz"
+    write_dumps(dump_dir, page=EN_PAGE_OLD_SCHEMA)
+    main.save_langlinks_index(
+        {"page_ids": np.array([1], dtype=np.int64),
+         "titles": {lang: ['Old'] for lang in main.TARGET_LANGUAGES}},
+        index_file
+    )
+    assert not main.is_langlinks_index_stale(index_file, dump_dir)
+    master_articles, _ = main.get_articles_from_langlinks_index(10, index_file, dump_dir)
+    assert master_articles == ['Old']
+
+    write_dumps(dump_dir)
+    page_file = main.get_dump_path('en', 'page', dump_dir)
+    newer = index_file.stat().st_mtime + 10
+    os.utime(page_file, (newer, newer))
+    assert main.is_langlinks_index_stale(index_file, dump_dir)
+
+    master_articles, master_titles = main.get_articles_from_langlinks_index(2, index_file, dump_dir)
+    assert master_articles == ['Water', "Rock 'n' roll"]
+    assert master_titles['Water'] == {'en': 'Water', 'tl': 'Tubig', 'ilo': 'Danum', 'ceb': 'Tubig'}
@@ -0,0 +1,86 @@
+"""
+Checks the pre-fetch filter decisions, their reuse across runs, and topping up
+the master list after rejections, without network access.
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main
+
+LENGTHS = {'Water': 5000, 'Stub': 100, 'Short': 2000}
+
+
+@pytest.fixture
+def page_info(monkeypatch):
+    """Serves page lengths from LENGTHS and counts the queries."""
+    queries = []
+
+    def fetch_page_info(lang_code, titles):
+        queries.append((lang_code, list(titles)))
+        return {title: {"missing": title not in LENGTHS, "length": LENGTHS.get(title, 0), "pageprops": {}}
+                for title in titles}
+
+    monkeypatch.setattr(main, 'fetch_page_info', fetch_page_info)
+    monkeypatch.setattr(main.time, 'sleep', lambda seconds: None)
+    return queries
+
+
+def test_decisions_are_saved_and_reused(tmp_path, page_info):
+    articles = ['Water', 'Stub', 'Gone']
+    assert main.prefilter_articles(articles, {}, tmp_path) == ['Water']
+
+    saved = json.loads((tmp_path / "prefilter_stats.json").read_text(encoding='utf-8'))
+    assert saved["accepted"] == ['Water']
+    assert saved["rejected"]['Stub'] == {lang: 'too_short' for lang in main.TARGET_LANGUAGES}
+    assert saved["rejections_by_language"]['en'] == {"missing": 1, "too_short": 1, "low_quality": 0}
+
+    page_info.clear()
+    assert main.prefilter_articles(articles, {}, tmp_path) == ['Water']
+    assert page_info == []
+
+
+def test_changed_thresholds_drop_saved_decisions(tmp_path, page_info, monkeypatch):
+    assert main.prefilter_articles(['Water', 'Short'], {}, tmp_path) == ['Water']
+
+    monkeypatch.setattr(main, 'MIN_ARTICLE_BYTES', {lang: 1000 for lang in main.TARGET_LANGUAGES})
+    page_info.clear()
+    assert main.prefilter_articles(['Water', 'Short'], {}, tmp_path) == ['Water', 'Short']
+    assert len(page_info) == len(main.TARGET_LANGUAGES)
+
+
+def test_failed_queries_are_checked_again(tmp_path, page_info, monkeypatch):
+    working_fetch = main.fetch_page_info
+    monkeypatch.setattr(main, 'fetch_page_info',
+                        lambda lang_code, titles: None if lang_code == 'ilo' else working_fetch(lang_code, titles))
+    # Kept for this run, but not recorded
+    assert main.prefilter_articles(['Water', 'Stub'], {}, tmp_path) == ['Water']
+    saved = json.loads((tmp_path / "prefilter_stats.json").read_text(encoding='utf-8'))
+    assert saved["accepted"] == []
+    assert 'Stub' in saved["rejected"]
+
+    monkeypatch.setattr(main, 'fetch_page_info', working_fetch)
+    page_info.clear()
+    assert main.prefilter_articles(['Water', 'Stub'], {}, tmp_path) == ['Water']
+    assert {titles[0] for _, titles in page_info} == {'Water'}
+
+
+def test_more_master_articles_come_from_the_index(tmp_path, monkeypatch):
+    candidates = ['A', 'B', 'C', 'D', 'E']
+    titles = {title: {lang: f"{title}-{lang}" for lang in main.TARGET_LANGUAGES} for title in candidates}
+    monkeypatch.setattr(main, 'get_articles_from_langlinks_index',
+                        lambda limit: (candidates[:limit], {t: titles[t] for t in candidates[:limit]}))
+
+    new_articles, new_titles = main.get_more_master_articles(['A', 'B'], {'A': titles['A']}, 2, tmp_path)
+    assert new_articles == ['C', 'D']
+    assert new_titles == {'C': titles['C'], 'D': titles['D']}
+
+
+def test_more_master_articles_come_from_discovery(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, 'get_articles_with_availability_check',
+                        lambda limit, storage_dir: ['A', 'B', 'C', 'D'][:limit])
+    assert main.get_more_master_articles(['A', 'B'], {}, 5, tmp_path) == (['C', 'D'], {})
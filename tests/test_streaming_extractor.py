@@ -0,0 +1,78 @@
+"""
+Checks that the streaming extractor returns exactly the same text as the
+BeautifulSoup extractor on the HTML fixtures, whatever the chunk size.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+FIXTURES = sorted(FIXTURES_DIR.glob("*.html"))
+CHUNK_SIZES = [1, 2, 7, 64, 1024, 16 * 1024]
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response serving a fixture."""
+
+    def __init__(self, content):
+        self.content = content
+        self.headers = {'Content-Type': 'text/html; charset=UTF-8'}
+        self.encoding = 'UTF-8'
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture
+def serve_fixture(monkeypatch):
+    def serve(fixture):
+        content = fixture.read_bytes()
+        monkeypatch.setattr(main.requests, 'get', lambda *args, **kwargs: FakeResponse(content))
+    return serve
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("fixture", FIXTURES, ids=lambda path: path.stem)
+def test_streaming_matches_beautifulsoup(fixture, chunk_size, serve_fixture, monkeypatch):
+    serve_fixture(fixture)
+    expected = main.scrape_wikipedia_article('en', fixture.stem)
+
+    monkeypatch.setattr(main, 'STREAM_CHUNK_SIZE', chunk_size)
+    assert main.scrape_wikipedia_article_streaming('en', fixture.stem) == expected
+
+
+def test_fixture_outcomes(serve_fixture):
+    serve_fixture(FIXTURES_DIR / "no_content.html")
+    assert main.scrape_wikipedia_article_streaming('en', 'No content') is None
+
+    serve_fixture(FIXTURES_DIR / "empty_content.html")
+    assert main.scrape_wikipedia_article_streaming('en', 'Empty content') == ''
+
+    serve_fixture(FIXTURES_DIR / "edge_cases.html")
+    text = main.scrape_wikipedia_article_streaming('en', 'Edge cases')
+    assert '&notit' in text
+    assert 'kept text' in text
+    assert 'Outside the content area' not in text
+
+
+def test_paragraphs_are_emitted_as_they_close():
+    parser = main.ParagraphParser()
+    parser.feed('<div id="mw-content-text"><p>First</p><p>Sec')
+    assert parser.pop_paragraphs() == ['First']
+    parser.feed('ond</p>')
+    assert parser.pop_paragraphs() == ['Second']
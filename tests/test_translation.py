@@ -0,0 +1,159 @@
+"""
+Checks the translation stage with the deterministic local backend and a
+temporary segment cache.
+"""
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main
+
+
+@pytest.fixture(autouse=True)
+def translation_cache(tmp_path, monkeypatch):
+    cache_file = tmp_path / "translation_cache.sqlite3"
+    monkeypatch.setattr(main, 'TRANSLATION_CACHE_FILE', cache_file)
+    monkeypatch.setattr(main, 'TRANSLATION_MIN_INTERVAL', 0)
+    return cache_file
+
+
+@pytest.fixture
+def backend():
+    """The local backend, recording the batches it receives."""
+    calls = []
+
+    def recording_backend(segments, from_lang, to_lang):
+        calls.append(list(segments))
+        return main.local_backend(segments, from_lang, to_lang)
+
+    recording_backend.calls = calls
+    return recording_backend
+
+
+def test_segmentation_round_trip(monkeypatch):
+    monkeypatch.setattr(main, 'MAX_BATCH_CHARS', 40)
+    text = ("Water is wet.  Is it?\nYes! "
+            "A sentence that is much longer than the forty character limit goes here.")
+    segments = main.split_into_segments(text)
+
+    assert segments[:3] == ['Water is wet.', 'Is it?', 'Yes!']
+    assert all(len(segment) <= 40 for segment in segments)
+    assert ' '.join(segments) == ' '.join(text.split())
+
+
+def test_batch_limits(monkeypatch):
+    monkeypatch.setattr(main, 'MAX_BATCH_CHARS', 100)
+    monkeypatch.setattr(main, 'MAX_BATCH_SEGMENTS', 3)
+
+    batches = main.batch_segments(['x' * 10] * 7)
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+
+    batches = main.batch_segments(['x' * 45, 'y' * 45, 'z' * 45])
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert all(sum(len(segment) + 1 for segment in batch) <= 100 for batch in batches)
+
+
+def test_local_backend_is_deterministic():
+    assert main.translate_text("Hello there.", 'en', 'tl', 'local') == "[en>tl] Hello there."
+    assert main.translate_text("Hello there.", 'en', 'en', 'local') == "Hello there."
+
+
+def test_duplicates_and_cache_hits(backend, capsys):
+    text = "One. Two. One. Three. Two. One."
+    expected = ' '.join(f"[en>tl] {segment}" for segment in text.split(' '))
+
+    assert main.translate_text(text, 'en', 'tl', backend, backend_name='recording') == expected
+    assert backend.calls == [['One.', 'Two.', 'Three.']]
+    assert "Translated 3/3 new segments in 1 calls (0 from cache)" in capsys.readouterr().out
+
+    assert main.translate_text("Two. Four.", 'en', 'tl', backend, backend_name='recording') == \
+        "[en>tl] Two. [en>tl] Four."
+    assert backend.calls[1:] == [['Four.']]
+    assert "(1 from cache)" in capsys.readouterr().out
+
+    # Fully cached text makes no backend call
+    main.translate_text(text, 'en', 'tl', backend, backend_name='recording')
+    assert len(backend.calls) == 2
+
+
+def test_cache_keys_per_backend_and_service(backend, monkeypatch):
+    main.translate_text("Hello.", 'en', 'tl', backend, backend_name='first')
+    main.translate_text("Hello.", 'en', 'tl', backend, backend_name='second')
+    main.translate_text("Hello.", 'en', 'ceb', backend, backend_name='first')
+    assert len(backend.calls) == 3
+
+    monkeypatch.setitem(main.TRANSLATION_BACKENDS, 'translators', backend)
+    monkeypatch.setattr(main, 'TRANSLATOR_SERVICE', 'google')
+    main.translate_text("Hello.", 'en', 'tl', 'translators')
+    monkeypatch.setattr(main, 'TRANSLATOR_SERVICE', 'bing')
+    main.translate_text("Hello.", 'en', 'tl', 'translators')
+    main.translate_text("Hello.", 'en', 'tl', 'translators')
+    assert len(backend.calls) == 5
+
+
+def test_callable_backend_requires_a_name():
+    with pytest.raises(ValueError):
+        main.translate_text("Hello.", 'en', 'tl', main.local_backend)
+
+
+def test_failed_batch_is_untranslated_and_uncached(backend, monkeypatch):
+    monkeypatch.setattr(main, 'MAX_BATCH_SEGMENTS', 1)
+
+    def failing_backend(segments, from_lang, to_lang):
+        if segments == ['Bad.']:
+            raise RuntimeError("service unavailable")
+        return main.local_backend(segments, from_lang, to_lang)
+
+    assert main.translate_text("Good. Bad.", 'en', 'tl', failing_backend, backend_name='flaky') == \
+        "[en>tl] Good. Bad."
+
+    keys = [main.get_segment_key(segment, 'en', 'tl', 'flaky') for segment in ('Good.', 'Bad.')]
+    assert list(main.get_cached_translations(keys)) == keys[:1]
+
+
+def test_cache_is_usable_from_other_threads(translation_cache, tmp_path):
+    assert main.translate_text("Hello.", 'en', 'tl', 'local') == "[en>tl] Hello."
+
+    results = []
+    thread = threading.Thread(target=lambda: results.append(main.translate_text("Hello. Bye.", 'en', 'tl', 'local')))
+    thread.start()
+    thread.join()
+    assert results == ["[en>tl] Hello. [en>tl] Bye."]
+
+    # Connections are kept per cache file
+    other_cache = tmp_path / "other.sqlite3"
+    main.save_translations({'key': 'value'}, other_cache)
+    assert main.get_cached_translations(['key'], other_cache) == {'key': 'value'}
+    assert main.get_cached_translations(['key']) == {}
+
+
+def test_unreadable_cache_counts_as_misses(tmp_path, backend, monkeypatch):
+    broken_cache = tmp_path / "broken.sqlite3"
+    broken_cache.write_bytes(b"not a database" * 100)
+    monkeypatch.setattr(main, 'TRANSLATION_CACHE_FILE', broken_cache)
+
+    assert main.translate_text("Hello.", 'en', 'tl', backend, backend_name='recording') == "[en>tl] Hello."
+    assert backend.calls == [['Hello.']]
+
+
+def test_translators_fallback_is_rate_limited(monkeypatch):
+    calls = []
+
+    class FakeTranslators:
+        @staticmethod
+        def translate_text(text, **kwargs):
+            calls.append(('translate', text))
+            # Merging the lines forces the one-by-one fallback
+            return text.replace('\n', ' ')
+
+    monkeypatch.setitem(sys.modules, 'translators', FakeTranslators)
+    monkeypatch.setattr(main, 'wait_for_rate_limit', lambda: calls.append(('wait', None)))
+
+    assert main.translators_backend(['One.', 'Two.'], 'en', 'tl') == ['One.', 'Two.']
+    assert calls == [('translate', 'One.\nTwo.'),
+                     ('wait', None), ('translate', 'One.'),
+                     ('wait', None), ('translate', 'Two.')]